@@ -8,6 +8,7 @@ from ...product.search import update_products_search_vector
 from ..core.mutations import ModelBulkDeleteMutation
 from ..core.types import AttributeError, NonNullList
 from ..plugins.dataloaders import load_plugin_manager
+from ..product.dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ..utils import resolve_global_ids_to_primary_keys
 from .types import Attribute, AttributeValue
 
@@ -67,6 +68,7 @@ class AttributeBulkDelete(ModelBulkDeleteMutation):
     def bulk_action(cls, info, queryset):
         attributes = list(queryset)
         queryset.delete()
+        UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
         manager = load_plugin_manager(info.context)
         for attribute in attributes:
             manager.attribute_deleted(attribute)
@@ -105,6 +107,7 @@ class AttributeValueBulkDelete(ModelBulkDeleteMutation):
         attributes = {value.attribute for value in queryset}
         values = list(queryset)
         queryset.delete()
+        UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
         manager = load_plugin_manager(info.context)
         for value in values:
             manager.attribute_value_deleted(value)
@@ -5,6 +5,7 @@ from ....core.permissions import ProductTypePermissions
 from ...core.mutations import ModelDeleteMutation
 from ...core.types import AttributeError
 from ...plugins.dataloaders import load_plugin_manager
+from ...product.dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ..types import Attribute
 
 
@@ -22,5 +23,6 @@ class AttributeDelete(ModelDeleteMutation):
 
     @classmethod
     def post_save_action(cls, info, instance, cleaned_input):
+        UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
         manager = load_plugin_manager(info.context)
         cls.call_event(manager.attribute_deleted, instance)
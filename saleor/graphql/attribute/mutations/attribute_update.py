@@ -8,6 +8,7 @@ from ...core.enums import MeasurementUnitsEnum
 from ...core.mutations import ModelMutation
 from ...core.types import AttributeError, NonNullList
 from ...plugins.dataloaders import load_plugin_manager
+from ...product.dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ..descriptions import AttributeDescriptions, AttributeValueDescriptions
 from ..types import Attribute
 from .attribute_create import AttributeValueInput
@@ -120,5 +121,7 @@ class AttributeUpdate(AttributeMixin, ModelMutation):
 
     @classmethod
     def post_save_action(cls, info, instance, cleaned_input):
+        if cleaned_input.get("remove_values"):
+            UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
         manager = load_plugin_manager(info.context)
         cls.call_event(manager.attribute_updated, instance)
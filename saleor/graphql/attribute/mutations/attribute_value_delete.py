@@ -7,6 +7,7 @@ from ....product import models as product_models
 from ...core.mutations import ModelDeleteMutation
 from ...core.types import AttributeError
 from ...plugins.dataloaders import load_plugin_manager
+from ...product.dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ..types import Attribute, AttributeValue
 
 
@@ -33,6 +34,7 @@ class AttributeValueDelete(ModelDeleteMutation):
         product_models.Product.objects.filter(id__in=product_ids).update(
             search_index_dirty=True
         )
+        UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
         manager = load_plugin_manager(info.context)
         cls.call_event(manager.attribute_value_deleted, instance)
         cls.call_event(manager.attribute_updated, instance.attribute)
@@ -7,6 +7,7 @@ from ....core.permissions import ProductTypePermissions
 from ....product import models as product_models
 from ...core.types import AttributeError
 from ...plugins.dataloaders import load_plugin_manager
+from ...product.dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ..types import Attribute, AttributeValue
 from .attribute_update import AttributeValueUpdateInput
 from .attribute_value_create import AttributeValueCreate
@@ -102,6 +103,7 @@ class AttributeValueUpdate(AttributeValueCreate):
                     search_index_dirty=True
                 )
 
+        UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
         manager = load_plugin_manager(info.context)
         cls.call_event(manager.attribute_value_updated, instance)
         cls.call_event(manager.attribute_updated, instance.attribute)
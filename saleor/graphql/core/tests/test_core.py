@@ -221,6 +221,14 @@ def test_get_duplicated_values():
     assert result == {"a", 1}
 
 
+def test_get_duplicated_values_from_iterator():
+    values = iter(["a", "b", "a", "c", "b", "a"])
+
+    result = get_duplicated_values(values)
+
+    assert result == {"a", "b"}
+
+
 def test_requestor_is_superuser_for_staff_user(staff_user):
     result = requestor_is_superuser(staff_user)
     assert result is False
@@ -270,6 +270,18 @@ def test_get_nodes(product_list):
     assert exc.value.args == (msg,)
 
 
+def test_get_nodes_preserves_order_of_given_ids(product_list):
+    # given
+    product_list.reverse()
+    global_ids = [to_global_id("Product", product.pk) for product in product_list]
+
+    # when
+    products = get_nodes(global_ids, Product)
+
+    # then
+    assert products == product_list
+
+
 def test_get_nodes_for_order_with_int_id(order_list):
     """Ensure that `get_nodes` returns correct nodes, when old id is used
     for orders with the `use_old_id` flag set to True."""
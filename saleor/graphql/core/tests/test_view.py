@@ -15,7 +15,12 @@ from ...tests.fixtures import (
     API_PATH,
 )
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
-from ...views import generate_cache_key
+from ...views import (
+    DOCUMENTS_CACHE_MAX_QUERY_LENGTH,
+    cached_document_from_string,
+    document_from_string,
+    generate_cache_key,
+)
 
 
 def test_batch_queries(category, product, api_client, channel_USD):
@@ -416,3 +421,35 @@ def test_introspection_query_is_not_cached_in_debug_mode(
 def test_generate_cache_key_use_saleor_version():
     cache_key = generate_cache_key(INTROSPECTION_QUERY)
     assert saleor_version in cache_key
+
+
+def test_document_from_string_reuses_parsed_document():
+    # given
+    backend = mock.Mock()
+    schema = mock.Mock()
+    query = "{ shop { name } }"
+    cached_document_from_string.cache_clear()
+
+    # when
+    document = document_from_string(backend, schema, query)
+    cached_document = document_from_string(backend, schema, query)
+
+    # then
+    assert document is cached_document
+    backend.document_from_string.assert_called_once_with(schema, query)
+
+
+def test_document_from_string_does_not_cache_long_queries():
+    # given
+    backend = mock.Mock()
+    schema = mock.Mock()
+    query = "{ shop { name } }".ljust(DOCUMENTS_CACHE_MAX_QUERY_LENGTH + 1)
+    cached_document_from_string.cache_clear()
+
+    # when
+    document_from_string(backend, schema, query)
+    document_from_string(backend, schema, query)
+
+    # then
+    assert backend.document_from_string.call_count == 2
+    assert cached_document_from_string.cache_info().currsize == 0
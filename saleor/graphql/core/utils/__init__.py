@@ -33,7 +33,14 @@ def get_duplicates_items(first_list, second_list):
 
 def get_duplicated_values(values):
     """Return set of duplicated values."""
-    return {value for value in values if values.count(value) > 1}
+    seen = set()
+    duplicates = set()
+    for value in values:
+        if value in seen:
+            duplicates.add(value)
+        else:
+            seen.add(value)
+    return duplicates
 
 
 def from_global_id_or_error(
@@ -7,6 +7,7 @@ from django.db import transaction
 from django.db.models import Exists, OuterRef, Q, Subquery
 from django.db.models.fields import IntegerField
 from django.db.models.functions import Coalesce
+from django.utils import timezone
 from graphene.types import InputObjectType
 
 from ....attribute import AttributeInputType
@@ -52,6 +53,7 @@ from ...warehouse.dataloaders import (
     StocksWithAvailableQuantityByProductVariantIdCountryCodeAndChannelLoader,
 )
 from ...warehouse.types import Warehouse
+from ..dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ..mutations.channels import ProductVariantChannelListingAddInput
 from ..mutations.product.product_create import StockInput
 from ..mutations.product_variant.product_variant_create import (
@@ -69,6 +71,7 @@ from ..types import (
 from ..utils import (
     clean_variant_sku,
     create_stocks,
+    get_attribute_values_fingerprint,
     get_draft_order_lines_data_for_variants,
     get_used_variants_attribute_values,
 )
@@ -198,8 +201,12 @@ class ProductBulkDelete(ModelBulkDeleteMutation):
 
         products = [product for product in queryset]
         queryset.delete()
+        used_attribute_values_loader = UsedVariantAttributeValuesByProductIdLoader(
+            info.context
+        )
         manager = load_plugin_manager(info.context)
         for product in products:
+            used_attribute_values_loader.clear(product.id)
             variants = product_variant_map.get(product.id, [])
             manager.product_deleted(product, variants)
 
@@ -457,15 +464,16 @@ class ProductVariantBulkCreate(BaseMutation):
         attribute_values = defaultdict(list)
         for attr in attributes_data:
             if "boolean" in attr:
-                attribute_values[attr.id] = attr["boolean"]
+                attribute_values[attr.id] = [attr["boolean"]]
             else:
                 attribute_values[attr.id].extend(attr.get("values", []))
-        if attribute_values in used_attribute_values:
+        fingerprint = get_attribute_values_fingerprint(attribute_values)
+        if fingerprint in used_attribute_values:
             raise ValidationError(
                 "Duplicated attribute values for product variant.",
                 ProductErrorCode.DUPLICATED_INPUT_ITEM,
             )
-        used_attribute_values.append(attribute_values)
+        used_attribute_values.add(fingerprint)
 
     @classmethod
     def clean_variants(cls, info, variants, product, errors):
@@ -533,9 +541,13 @@ class ProductVariantBulkCreate(BaseMutation):
             cls.create_variant_stocks(instance, cleaned_input)
             cls.create_variant_channel_listings(instance, cleaned_input)
 
-        if not product.default_variant:
-            product.default_variant = instances[0]
-            product.save(update_fields=["default_variant", "updated_at"])
+        if not product.default_variant_id:
+            updated = models.Product.objects.filter(
+                pk=product.pk, default_variant__isnull=True
+            ).update(default_variant=instances[0], updated_at=timezone.now())
+            if updated:
+                product.default_variant = instances[0]
+        UsedVariantAttributeValuesByProductIdLoader(info.context).clear(product.pk)
 
     @classmethod
     def create_variant_stocks(cls, variant, cleaned_input):
@@ -637,6 +649,11 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
         cls.delete_assigned_attribute_values(pks)
         cls.delete_product_channel_listings_without_available_variants(product_pks, pks)
         response = super().perform_mutation(_root, info, ids, **data)
+        used_attribute_values_loader = UsedVariantAttributeValuesByProductIdLoader(
+            info.context
+        )
+        for product_pk in product_pks:
+            used_attribute_values_loader.clear(product_pk)
         manager = load_plugin_manager(info.context)
         transaction.on_commit(
             lambda: [manager.product_variant_deleted(variant) for variant in variants]
@@ -992,7 +1009,9 @@ class ProductTypeBulkDelete(ModelBulkDeleteMutation):
         except ValidationError as error:
             return 0, error
         cls.delete_assigned_attribute_values(pks)
-        return super().perform_mutation(_root, info, ids, **data)
+        response = super().perform_mutation(_root, info, ids, **data)
+        UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
+        return response
 
     @staticmethod
     def delete_assigned_attribute_values(instance_pks):
@@ -2,6 +2,7 @@ from .attributes import (
     ProductAttributesByProductTypeIdLoader,
     SelectedAttributesByProductIdLoader,
     SelectedAttributesByProductVariantIdLoader,
+    UsedVariantAttributeValuesByProductIdLoader,
     VariantAttributesByProductTypeIdLoader,
 )
 from .products import (
@@ -73,6 +74,7 @@ __all__ = [
     "ThumbnailByCategoryIdSizeAndFormatLoader",
     "ThumbnailByCollectionIdSizeAndFormatLoader",
     "ThumbnailByProductMediaIdSizeAndFormatLoader",
+    "UsedVariantAttributeValuesByProductIdLoader",
     "VariantAttributesByProductTypeIdLoader",
     "VariantChannelListingByVariantIdAndChannelSlugLoader",
     "VariantChannelListingByVariantIdAndChannelIdLoader",
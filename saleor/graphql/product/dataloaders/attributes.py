@@ -14,6 +14,7 @@ from ....core.permissions import ProductPermissions
 from ...attribute.dataloaders import AttributesByAttributeId, AttributeValueByIdLoader
 from ...core.dataloaders import DataLoader
 from ...utils import get_user_or_app_from_context
+from ..utils import get_used_variants_attribute_values_by_product_id
 from .products import ProductByIdLoader, ProductVariantByIdLoader
 
 
@@ -193,6 +194,23 @@ class AssignedVariantAttributesByProductVariantId(DataLoader):
         return [variant_attributes[variant_id] for variant_id in keys]
 
 
+class UsedVariantAttributeValuesByProductIdLoader(DataLoader):
+    """Load fingerprints of attribute values assigned to variants of products.
+
+    The loaded sets are shared by all mutations executed within a request,
+    so mutations changing the variants of a product should keep them up to date
+    or clear them.
+    """
+
+    context_key = "used_variant_attribute_values_by_product"
+
+    def batch_load(self, keys):
+        used_attribute_values = get_used_variants_attribute_values_by_product_id(
+            keys, self.database_connection_name
+        )
+        return [used_attribute_values[product_id] for product_id in keys]
+
+
 class AttributeValuesByAssignedProductAttributeIdLoader(DataLoader):
     context_key = "attributevalues_by_assignedproductattribute"
 
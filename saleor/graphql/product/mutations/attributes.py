@@ -23,6 +23,7 @@ from ...core.inputs import ReorderInput
 from ...core.mutations import BaseMutation
 from ...core.types import NonNullList, ProductError
 from ...core.utils.reordering import perform_reordering
+from ...product.dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ...product.types import Product, ProductType, ProductVariant
 from ..enums import ProductAttributeType
 
@@ -345,6 +346,7 @@ class ProductAttributeUnassign(BaseMutation):
         # Commit
         cls.save_field_values(product_type, "product_attributes", attribute_pks)
         cls.save_field_values(product_type, "variant_attributes", attribute_pks)
+        UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
 
         update_products_search_vector(product_type.products.all())
 
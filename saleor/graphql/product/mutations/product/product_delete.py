@@ -13,6 +13,7 @@ from ....channel import ChannelContext
 from ....core.mutations import ModelDeleteMutation
 from ....core.types import ProductError
 from ....plugins.dataloaders import load_plugin_manager
+from ...dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ...types import Product
 from ...utils import get_draft_order_lines_data_for_variants
 
@@ -48,6 +49,9 @@ class ProductDelete(ModelDeleteMutation):
             )
 
             response = super().perform_mutation(_root, info, **data)
+            UsedVariantAttributeValuesByProductIdLoader(info.context).clear(
+                instance.pk
+            )
 
             # delete order lines for deleted variant
             order_models.OrderLine.objects.filter(
@@ -10,6 +10,7 @@ from .....order import models as order_models
 from .....product import models
 from ....core.mutations import ModelDeleteMutation
 from ....core.types import ProductError
+from ...dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ...types import ProductType
 
 
@@ -44,6 +45,7 @@ class ProductTypeDelete(ModelDeleteMutation):
         cls.delete_assigned_attribute_values(product_type_pk)
 
         response = super().perform_mutation(_root, info, **data)
+        UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
 
         # delete order lines for deleted variants
         order_models.OrderLine.objects.filter(pk__in=order_line_pks).delete()
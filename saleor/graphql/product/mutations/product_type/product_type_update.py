@@ -4,6 +4,7 @@ from .....core.permissions import ProductTypePermissions
 from .....product import models
 from .....product.tasks import update_variants_names
 from ....core.types import ProductError
+from ...dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ...types import ProductType
 from .product_type_create import ProductTypeCreate, ProductTypeInput
 
@@ -45,3 +46,5 @@ class ProductTypeUpdate(ProductTypeCreate):
             models.Product.objects.filter(product_type=instance).update(
                 search_index_dirty=True
             )
+        if "variant_attributes" in cleaned_input:
+            UsedVariantAttributeValuesByProductIdLoader(info.context).clear_all()
@@ -3,6 +3,9 @@ from typing import List, Tuple
 
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
 from django.utils.text import slugify
 
 from .....attribute import AttributeInputType
@@ -11,7 +14,6 @@ from .....core.permissions import ProductPermissions
 from .....core.tracing import traced_atomic_transaction
 from .....product import models
 from .....product.error_codes import ProductErrorCode
-from .....product.search import update_product_search_vector
 from .....product.tasks import update_product_discounted_price_task
 from .....product.utils.variants import generate_and_set_variant_name
 from ....attribute.types import AttributeValueInput
@@ -25,11 +27,14 @@ from ....core.utils import get_duplicated_values
 from ....meta.mutations import MetadataInput
 from ....plugins.dataloaders import load_plugin_manager
 from ....warehouse.types import Warehouse
+from ...dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ...types import ProductVariant
 from ...utils import (
     clean_variant_sku,
     create_stocks,
-    get_used_variants_attribute_values,
+    get_attribute_global_id,
+    get_attribute_values_fingerprint,
+    get_used_attribute_values_for_variant,
 )
 from ..product.product_create import StockInput
 
@@ -122,6 +127,16 @@ class ProductVariantCreate(ModelMutation):
         support_meta_field = True
         support_private_meta_field = True
 
+    @classmethod
+    def get_node_or_error(
+        cls, info, node_id, field="id", only_type=None, qs=None, code="not_found"
+    ):
+        if field == "product" and qs is None:
+            # The product type of the product is needed to clean the variant input
+            qs = models.Product.objects.select_related("product_type")
+            only_type = "Product"
+        return super().get_node_or_error(info, node_id, field, only_type, qs, code)
+
     @classmethod
     def clean_attributes(
         cls, attributes: dict, product_type: models.ProductType
@@ -130,29 +145,34 @@ class ProductVariantCreate(ModelMutation):
         attributes = AttributeAssignmentMixin.clean_input(attributes, attributes_qs)
         return attributes
 
+    @staticmethod
+    def get_input_attribute_values(attributes_data: T_INPUT_MAP) -> dict:
+        """Map the cleaned attributes input to the slugs of the values to assign."""
+        attribute_values = defaultdict(list)
+        for attr, attr_data in attributes_data:
+            values = attribute_values[attr_data.global_id]
+            if attr.input_type != AttributeInputType.FILE:
+                values.extend(attr_data.values)
+            elif attr_data.file_url:
+                values.append(slugify(attr_data.file_url.rsplit("/", 1)[-1]))
+        return attribute_values
+
     @classmethod
     def validate_duplicated_attribute_values(
         cls, attributes_data, used_attribute_values, instance=None
     ):
-        attribute_values = defaultdict(list)
-        for attr, attr_data in attributes_data:
-            if attr.input_type == AttributeInputType.FILE:
-                values = (
-                    [slugify(attr_data.file_url.split("/")[-1])]
-                    if attr_data.file_url
-                    else []
-                )
-            else:
-                values = attr_data.values
-            attribute_values[attr_data.global_id].extend(values)
-        if attribute_values in used_attribute_values:
+        if not used_attribute_values:
+            # No other variant has attribute values assigned, so the given values
+            # can't be duplicated
+            return
+        attribute_values = cls.get_input_attribute_values(attributes_data)
+        fingerprint = get_attribute_values_fingerprint(attribute_values)
+        if fingerprint in used_attribute_values:
             raise ValidationError(
                 "Duplicated attribute values for product variant.",
                 code=ProductErrorCode.DUPLICATED_INPUT_ITEM.value,
-                params={"attributes": attribute_values.keys()},
+                params={"attributes": list(attribute_values.keys())},
             )
-        else:
-            used_attribute_values.append(attribute_values)
 
     @classmethod
     def clean_input(
@@ -192,31 +212,34 @@ class ProductVariantCreate(ModelMutation):
         if instance.pk:
             # If the variant is getting updated,
             # simply retrieve the associated product type
-            product_type = instance.product.product_type
-            used_attribute_values = get_used_variants_attribute_values(instance.product)
+            product = instance.product
         else:
             # If the variant is getting created, no product type is associated yet,
             # retrieve it from the required "product" input field
-            product_type = cleaned_input["product"].product_type
-            used_attribute_values = get_used_variants_attribute_values(
-                cleaned_input["product"]
-            )
-
-        variant_attributes_ids = {
-            graphene.Node.to_global_id("Attribute", attr_id)
-            for attr_id in list(
-                product_type.variant_attributes.all().values_list("pk", flat=True)
-            )
-        }
+            product = cleaned_input["product"]
+        product_type = product.product_type
         attributes = cleaned_input.get("attributes")
-        attributes_ids = {attr["id"] for attr in attributes or []}
-        invalid_attributes = attributes_ids - variant_attributes_ids
-        if len(invalid_attributes) > 0:
-            raise ValidationError(
-                "Given attributes are not a variant attributes.",
-                code=ProductErrorCode.ATTRIBUTE_CANNOT_BE_ASSIGNED.value,
-                params={"attributes": invalid_attributes},
-            )
+
+        # The variant attributes are needed only to validate the given attributes,
+        # or to check if any of them is required when creating a configurable variant
+        variant_attributes = (
+            list(product_type.variant_attributes.all())
+            if attributes or (product_type.has_variants and not instance.pk)
+            else []
+        )
+
+        if attributes:
+            variant_attributes_ids = {
+                get_attribute_global_id(attr.pk) for attr in variant_attributes
+            }
+            attributes_ids = {attr["id"] for attr in attributes}
+            invalid_attributes = attributes_ids - variant_attributes_ids
+            if len(invalid_attributes) > 0:
+                raise ValidationError(
+                    "Given attributes are not a variant attributes.",
+                    code=ProductErrorCode.ATTRIBUTE_CANNOT_BE_ASSIGNED.value,
+                    params={"attributes": invalid_attributes},
+                )
 
         # Run the validation only if product type is configurable
         if product_type.has_variants:
@@ -224,31 +247,37 @@ class ProductVariantCreate(ModelMutation):
             # We need to transform them into the format they're stored in the
             # `Product` model, which is HStore field that maps attribute's PK to
             # the value's PK.
-            try:
-                if attributes:
+            if attributes:
+                try:
                     cleaned_attributes = cls.clean_attributes(attributes, product_type)
+                    used_attribute_values = (
+                        UsedVariantAttributeValuesByProductIdLoader(info.context)
+                        .load(product.pk)
+                        .get()
+                    )
                     cls.validate_duplicated_attribute_values(
                         cleaned_attributes, used_attribute_values, instance
                     )
-                    cleaned_input["attributes"] = cleaned_attributes
-                # elif not instance.pk and not attributes:
-                elif not instance.pk and (
-                    not attributes
-                    and product_type.variant_attributes.filter(value_required=True)
-                ):
-                    # if attributes were not provided on creation
-                    raise ValidationError(
-                        "All required attributes must take a value.",
-                        ProductErrorCode.REQUIRED.value,
-                    )
-            except ValidationError as exc:
-                raise ValidationError({"attributes": exc})
-        else:
-            if attributes:
+                except ValidationError as exc:
+                    raise ValidationError({"attributes": exc})
+                cleaned_input["attributes"] = cleaned_attributes
+            elif not instance.pk and any(
+                attr.value_required for attr in variant_attributes
+            ):
+                # if attributes were not provided on creation
                 raise ValidationError(
-                    "Cannot assign attributes for product type without variants",
-                    ProductErrorCode.INVALID.value,
+                    {
+                        "attributes": ValidationError(
+                            "All required attributes must take a value.",
+                            ProductErrorCode.REQUIRED.value,
+                        )
+                    }
                 )
+        elif attributes:
+            raise ValidationError(
+                "Cannot assign attributes for product type without variants",
+                ProductErrorCode.INVALID.value,
+            )
 
         if "sku" in cleaned_input:
             cleaned_input["sku"] = clean_variant_sku(cleaned_input.get("sku"))
@@ -265,8 +294,7 @@ class ProductVariantCreate(ModelMutation):
 
     @classmethod
     def check_for_duplicates_in_stocks(cls, stocks_data):
-        warehouse_ids = [stock["warehouse"] for stock in stocks_data]
-        duplicates = get_duplicated_values(warehouse_ids)
+        duplicates = get_duplicated_values(stock["warehouse"] for stock in stocks_data)
         if duplicates:
             error_msg = "Duplicated warehouse ID: {}".format(", ".join(duplicates))
             raise ValidationError(
@@ -292,13 +320,15 @@ class ProductVariantCreate(ModelMutation):
         if attributes:
             # Prefetches needed by AttributeAssignmentMixin and
             # associate_attribute_values_to_instance
-            qs = cls.Meta.model.objects.prefetch_related(
+            qs = cls.Meta.model.objects.select_related(
+                "product__product_type"
+            ).prefetch_related(
                 "product__product_type__variant_attributes__values",
                 "product__product_type__attributevariant",
             )
         else:
             # Use the default queryset.
-            qs = models.ProductVariant.objects.all()
+            qs = models.ProductVariant.objects.select_related("product__product_type")
 
         if object_id:
             return cls.get_node_or_error(
@@ -324,11 +354,16 @@ class ProductVariantCreate(ModelMutation):
         new_variant = instance.pk is None
         with traced_atomic_transaction():
             instance.save()
-            if not instance.product.default_variant:
-                instance.product.default_variant = instance
-                instance.product.save(update_fields=["default_variant", "updated_at"])
-            # Recalculate the "discounted price" for the parent product
-            update_product_discounted_price_task.delay(instance.product_id)
+            if not instance.product.default_variant_id:
+                updated = models.Product.objects.filter(
+                    pk=instance.product_id, default_variant__isnull=True
+                ).update(default_variant=instance, updated_at=timezone.now())
+                if updated:
+                    instance.product.default_variant = instance
+            # The search vector of the product is updated by the periodic task
+            models.Product.objects.filter(pk=instance.product_id).update(
+                search_index_dirty=True
+            )
             stocks = cleaned_input.get("stocks")
             if stocks:
                 cls.create_variant_stocks(instance, stocks)
@@ -336,12 +371,19 @@ class ProductVariantCreate(ModelMutation):
             attributes = cleaned_input.get("attributes")
             if attributes:
                 AttributeAssignmentMixin.save(instance, attributes)
+                cls.update_used_attribute_values(info, instance, new_variant)
 
             if not instance.name:
                 generate_and_set_variant_name(instance, cleaned_input.get("sku"))
 
+            product_id = instance.product_id
+            # Recalculate the "discounted price" for the parent product once
+            # the variant is committed
+            transaction.on_commit(
+                lambda: update_product_discounted_price_task.delay(product_id)
+            )
+
             manager = load_plugin_manager(info.context)
-            update_product_search_vector(instance.product)
             event_to_call = (
                 manager.product_variant_created
                 if new_variant
@@ -349,6 +391,25 @@ class ProductVariantCreate(ModelMutation):
             )
             cls.call_event(event_to_call, instance)
 
+    @classmethod
+    def update_used_attribute_values(cls, info, instance, new_variant):
+        # The used attribute values are shared between the mutations run within
+        # the request, so they have to reflect the saved variant
+        loader = UsedVariantAttributeValuesByProductIdLoader(info.context)
+        product_id = instance.product_id
+        if not new_variant:
+            loader.clear(product_id)
+            return
+        # Values given by name are saved with their slugs, so the fingerprint is
+        # built from the saved values instead of the input
+        prefetch_related_objects(
+            [instance], "attributes__assignment__attribute", "attributes__values"
+        )
+        fingerprint = get_attribute_values_fingerprint(
+            get_used_attribute_values_for_variant(instance)
+        )
+        transaction.on_commit(lambda: loader.load(product_id).get().add(fingerprint))
+
     @classmethod
     def create_variant_stocks(cls, variant, stocks):
         warehouse_ids = [stock["warehouse"] for stock in stocks]
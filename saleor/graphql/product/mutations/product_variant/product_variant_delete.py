@@ -20,6 +20,7 @@ from ....core.mutations import ModelDeleteMutation
 from ....core.types import ProductError
 from ....core.validators import validate_one_of_args_is_in_mutation
 from ....plugins.dataloaders import load_plugin_manager
+from ...dataloaders import UsedVariantAttributeValuesByProductIdLoader
 from ...types import ProductVariant
 from ...utils import get_draft_order_lines_data_for_variants
 
@@ -88,6 +89,9 @@ class ProductVariantDelete(ModelDeleteMutation):
             cls.delete_assigned_attribute_values(variant)
             cls.delete_product_channel_listings_without_available_variants(variant)
             response = super().perform_mutation(_root, info, **data)
+            UsedVariantAttributeValuesByProductIdLoader(info.context).clear(
+                variant.product_id
+            )
 
             # delete order lines for deleted variant
             order_models.OrderLine.objects.filter(
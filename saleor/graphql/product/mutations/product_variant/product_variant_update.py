@@ -1,10 +1,7 @@
-from collections import defaultdict
 from typing import List, Tuple
 
 import graphene
-from django.utils.text import slugify
 
-from .....attribute import AttributeInputType
 from .....attribute import models as attribute_models
 from .....core.permissions import ProductPermissions
 from .....product import models
@@ -14,7 +11,10 @@ from ....core.descriptions import ADDED_IN_38
 from ....core.types import ProductError
 from ....core.validators import validate_one_of_args_is_in_mutation
 from ...types import ProductVariant
-from ...utils import get_used_attribute_values_for_variant
+from ...utils import (
+    get_attribute_values_fingerprint,
+    get_used_attribute_values_for_variant,
+)
 from .product_variant_create import ProductVariantCreate, ProductVariantInput
 
 T_INPUT_MAP = List[Tuple[attribute_models.Attribute, AttrValuesInput]]
@@ -58,22 +58,16 @@ class ProductVariantUpdate(ProductVariantCreate):
     def validate_duplicated_attribute_values(
         cls, attributes_data, used_attribute_values, instance=None
     ):
+        if not used_attribute_values:
+            return
         # Check if the variant is getting updated,
         # and the assigned attributes do not change
         if instance.product_id is not None:
             assigned_attributes = get_used_attribute_values_for_variant(instance)
-            input_attribute_values = defaultdict(list)
-            for attr, attr_data in attributes_data:
-                if attr.input_type == AttributeInputType.FILE:
-                    values = (
-                        [slugify(attr_data.file_url.split("/")[-1])]
-                        if attr_data.file_url
-                        else []
-                    )
-                else:
-                    values = attr_data.values
-                input_attribute_values[attr_data.global_id].extend(values)
-            if input_attribute_values == assigned_attributes:
+            input_attribute_values = cls.get_input_attribute_values(attributes_data)
+            if get_attribute_values_fingerprint(
+                input_attribute_values
+            ) == get_attribute_values_fingerprint(assigned_attributes):
                 return
         # if assigned attributes is getting updated run duplicated attribute validation
         super().validate_duplicated_attribute_values(
@@ -4,6 +4,7 @@ from unittest.mock import ANY, patch
 from uuid import uuid4
 
 import graphene
+import pytest
 import pytz
 from django.conf import settings
 from django.utils.text import slugify
@@ -13,6 +14,7 @@ from .....product.error_codes import ProductErrorCode
 from .....tests.utils import dummy_editorjs, flush_post_commit_hooks
 from ....core.enums import WeightUnitsEnum
 from ....tests.utils import get_graphql_content
+from ...utils import get_used_variants_attribute_values_by_product_id
 
 CREATE_VARIANT_MUTATION = """
       mutation createVariant ($input: ProductVariantCreateInput!) {
@@ -147,6 +149,87 @@ def test_create_variant_with_name(
     updated_webhook_mock.assert_not_called()
 
 
+@pytest.mark.parametrize("has_default_variant", [True, False])
+def test_create_variant_sets_product_default_variant(
+    has_default_variant,
+    staff_api_client,
+    product,
+    product_type,
+    permission_manage_products,
+):
+    # given
+    existing_variant = product.variants.first()
+    product.default_variant = existing_variant if has_default_variant else None
+    product.save(update_fields=["default_variant"])
+
+    product_id = graphene.Node.to_global_id("Product", product.pk)
+    attribute_id = graphene.Node.to_global_id(
+        "Attribute", product_type.variant_attributes.first().pk
+    )
+    variables = {
+        "input": {
+            "product": product_id,
+            "sku": "1",
+            "attributes": [{"id": attribute_id, "values": ["test-value"]}],
+        }
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CREATE_VARIANT_MUTATION, variables, permissions=[permission_manage_products]
+    )
+    content = get_graphql_content(response)["data"]["productVariantCreate"]
+
+    # then
+    assert not content["errors"]
+    product.refresh_from_db()
+    new_variant = product.variants.get(sku="1")
+    expected_default_variant = existing_variant if has_default_variant else new_variant
+    assert product.default_variant == expected_default_variant
+
+
+@patch(
+    "saleor.graphql.product.mutations.product_variant.product_variant_create"
+    ".update_product_discounted_price_task"
+)
+def test_create_variant_updates_product_after_commit(
+    update_product_discounted_price_task_mock,
+    staff_api_client,
+    product,
+    product_type,
+    permission_manage_products,
+):
+    # given
+    product_id = graphene.Node.to_global_id("Product", product.pk)
+    attribute_id = graphene.Node.to_global_id(
+        "Attribute", product_type.variant_attributes.first().pk
+    )
+    variables = {
+        "input": {
+            "product": product_id,
+            "sku": "1",
+            "attributes": [{"id": attribute_id, "values": ["test-value"]}],
+        }
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CREATE_VARIANT_MUTATION, variables, permissions=[permission_manage_products]
+    )
+    content = get_graphql_content(response)["data"]["productVariantCreate"]
+
+    # then
+    assert not content["errors"]
+    product.refresh_from_db()
+    assert product.search_index_dirty is True
+    update_product_discounted_price_task_mock.delay.assert_not_called()
+
+    flush_post_commit_hooks()
+    update_product_discounted_price_task_mock.delay.assert_called_once_with(
+        product.pk
+    )
+
+
 @patch("saleor.plugins.manager.PluginsManager.product_variant_created")
 @patch("saleor.plugins.manager.PluginsManager.product_variant_updated")
 def test_create_variant_without_name(
@@ -1322,6 +1405,234 @@ def test_create_product_variant_duplicated_attributes(
     assert not product.variants.filter(sku=sku).exists()
 
 
+CREATE_TWO_VARIANTS_MUTATION = """
+    mutation createVariants (
+        $firstInput: ProductVariantCreateInput!,
+        $secondInput: ProductVariantCreateInput!
+    ) {
+        first: productVariantCreate(input: $firstInput) {
+            errors {
+                field
+                code
+                attributes
+            }
+            productVariant {
+                sku
+            }
+        }
+        second: productVariantCreate(input: $secondInput) {
+            errors {
+                field
+                code
+                attributes
+            }
+            productVariant {
+                sku
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize(
+    "first_values, second_values",
+    [
+        (["green", "big"], ["green", "big"]),
+        (["Blue", "Small"], ["blue", "small"]),
+    ],
+)
+@patch(
+    "saleor.graphql.product.dataloaders.attributes"
+    ".get_used_variants_attribute_values_by_product_id",
+    wraps=get_used_variants_attribute_values_by_product_id,
+)
+def test_create_product_variants_duplicated_attributes_in_one_request(
+    get_used_variants_attribute_values_mock,
+    first_values,
+    second_values,
+    staff_api_client,
+    product_with_variant_with_two_attributes,
+    color_attribute,
+    size_attribute,
+    permission_manage_products,
+):
+    # given
+    product = product_with_variant_with_two_attributes
+    product_id = graphene.Node.to_global_id("Product", product.pk)
+    color_attribute_id = graphene.Node.to_global_id("Attribute", color_attribute.id)
+    size_attribute_id = graphene.Node.to_global_id("Attribute", size_attribute.id)
+    variables = {
+        "firstInput": {
+            "product": product_id,
+            "sku": "1",
+            "attributes": [
+                {"id": color_attribute_id, "values": [first_values[0]]},
+                {"id": size_attribute_id, "values": [first_values[1]]},
+            ],
+        },
+        "secondInput": {
+            "product": product_id,
+            "sku": "2",
+            "attributes": [
+                {"id": color_attribute_id, "values": [second_values[0]]},
+                {"id": size_attribute_id, "values": [second_values[1]]},
+            ],
+        },
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CREATE_TWO_VARIANTS_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    content = get_graphql_content(response)["data"]
+    assert not content["first"]["errors"]
+    assert content["first"]["productVariant"]["sku"] == "1"
+    assert content["second"]["errors"] == [
+        {
+            "field": "attributes",
+            "code": ProductErrorCode.DUPLICATED_INPUT_ITEM.name,
+            "attributes": [color_attribute_id, size_attribute_id],
+        }
+    ]
+    assert not product.variants.filter(sku="2").exists()
+    # the used attribute values are fetched once and shared by both mutations
+    get_used_variants_attribute_values_mock.assert_called_once()
+
+
+@pytest.mark.django_db(transaction=True)
+@patch(
+    "saleor.graphql.product.dataloaders.attributes"
+    ".get_used_variants_attribute_values_by_product_id",
+    wraps=get_used_variants_attribute_values_by_product_id,
+)
+def test_create_product_variants_different_dropdown_values_in_one_request(
+    get_used_variants_attribute_values_mock,
+    staff_api_client,
+    product_with_variant_with_two_attributes,
+    color_attribute,
+    permission_manage_products,
+):
+    # given
+    product = product_with_variant_with_two_attributes
+    product_id = graphene.Node.to_global_id("Product", product.pk)
+    color_attribute_id = graphene.Node.to_global_id("Attribute", color_attribute.id)
+    variables = {
+        "firstInput": {
+            "product": product_id,
+            "sku": "1",
+            "attributes": [{"id": color_attribute_id, "dropdown": {"value": "Blue"}}],
+        },
+        "secondInput": {
+            "product": product_id,
+            "sku": "2",
+            "attributes": [{"id": color_attribute_id, "dropdown": {"value": "Green"}}],
+        },
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CREATE_TWO_VARIANTS_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    content = get_graphql_content(response)["data"]
+    assert not content["first"]["errors"]
+    assert content["first"]["productVariant"]["sku"] == "1"
+    assert not content["second"]["errors"]
+    assert content["second"]["productVariant"]["sku"] == "2"
+    get_used_variants_attribute_values_mock.assert_called_once()
+
+
+CREATE_VARIANTS_WITH_ATTRIBUTE_VALUE_DELETE_MUTATION = """
+    mutation createVariants (
+        $firstInput: ProductVariantCreateInput!,
+        $valueId: ID!,
+        $secondInput: ProductVariantCreateInput!
+    ) {
+        first: productVariantCreate(input: $firstInput) {
+            errors {
+                field
+                code
+            }
+        }
+        attributeValueDelete(id: $valueId) {
+            errors {
+                field
+                code
+            }
+        }
+        second: productVariantCreate(input: $secondInput) {
+            errors {
+                field
+                code
+            }
+            productVariant {
+                sku
+            }
+        }
+    }
+"""
+
+
+def test_create_product_variants_after_deleting_used_attribute_value_in_one_request(
+    staff_api_client,
+    product_with_variant_with_two_attributes,
+    color_attribute,
+    size_attribute,
+    permission_manage_products,
+    permission_manage_product_types_and_attributes,
+):
+    # given
+    product = product_with_variant_with_two_attributes
+    product_id = graphene.Node.to_global_id("Product", product.pk)
+    color_attribute_id = graphene.Node.to_global_id("Attribute", color_attribute.id)
+    size_attribute_id = graphene.Node.to_global_id("Attribute", size_attribute.id)
+    used_value = color_attribute.values.get(slug="red")
+    variables = {
+        "firstInput": {
+            "product": product_id,
+            "sku": "1",
+            "attributes": [
+                {"id": color_attribute_id, "values": ["green"]},
+                {"id": size_attribute_id, "values": ["big"]},
+            ],
+        },
+        "valueId": graphene.Node.to_global_id("AttributeValue", used_value.pk),
+        "secondInput": {
+            "product": product_id,
+            "sku": "2",
+            "attributes": [
+                {"id": color_attribute_id, "values": ["red"]},
+                {"id": size_attribute_id, "values": ["small"]},
+            ],
+        },
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CREATE_VARIANTS_WITH_ATTRIBUTE_VALUE_DELETE_MUTATION,
+        variables,
+        permissions=[
+            permission_manage_products,
+            permission_manage_product_types_and_attributes,
+        ],
+    )
+
+    # then
+    content = get_graphql_content(response)["data"]
+    assert not content["first"]["errors"]
+    assert not content["attributeValueDelete"]["errors"]
+    assert not content["second"]["errors"]
+    assert content["second"]["productVariant"]["sku"] == "2"
+
+
 def test_create_variant_invalid_variant_attributes(
     staff_api_client,
     product,
@@ -1837,3 +2148,59 @@ def test_variant_create_product_with_variant_attributes_variant_flag_false(
     errors = content["data"]["productVariantCreate"]["errors"]
     assert errors
     assert errors[0]["code"] == ProductErrorCode.INVALID.name
+
+
+@patch(
+    "saleor.graphql.product.dataloaders.attributes"
+    ".get_used_variants_attribute_values_by_product_id"
+)
+def test_variant_create_product_type_without_variants_no_attributes(
+    get_used_variants_attribute_values_mock,
+    product,
+    staff_api_client,
+    permission_manage_products,
+):
+    # given
+    product_type = product.product_type
+    product_type.has_variants = False
+    product_type.save(update_fields=["has_variants"])
+
+    prod_id = graphene.Node.to_global_id("Product", product.pk)
+    input = {"sku": "my-sku", "product": prod_id, "attributes": []}
+
+    # when
+    response = staff_api_client.post_graphql(
+        VARIANT_CREATE_MUTATION,
+        variables={"input": input},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+
+    # then
+    data = content["data"]["productVariantCreate"]
+    assert not data["errors"]
+    assert product.variants.filter(sku=input["sku"]).exists()
+    get_used_variants_attribute_values_mock.assert_not_called()
+
+
+def test_variant_create_product_id_of_other_type(
+    product, staff_api_client, permission_manage_products
+):
+    # given
+    category_id = graphene.Node.to_global_id("Category", product.pk)
+    input = {"sku": "my-sku", "product": category_id, "attributes": []}
+
+    # when
+    response = staff_api_client.post_graphql(
+        VARIANT_CREATE_MUTATION,
+        variables={"input": input},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+
+    # then
+    errors = content["data"]["productVariantCreate"]["errors"]
+    assert len(errors) == 1
+    assert errors[0]["field"] == "product"
+    assert errors[0]["code"] == ProductErrorCode.GRAPHQL_ERROR.name
+    assert not product.variants.filter(sku=input["sku"]).exists()
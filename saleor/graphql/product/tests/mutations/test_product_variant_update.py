@@ -9,8 +9,8 @@ import pytz
 from django.conf import settings
 from django.utils.text import slugify
 
-from .....attribute import AttributeInputType
-from .....attribute.models import AttributeValue
+from .....attribute import AttributeInputType, AttributeType
+from .....attribute.models import Attribute, AttributeValue
 from .....attribute.utils import associate_attribute_values_to_instance
 from .....product.error_codes import ProductErrorCode
 from .....tests.utils import flush_post_commit_hooks
@@ -557,6 +557,55 @@ def test_update_product_variant_with_current_attribute(
     assert variant.attributes.last().values.first().slug == "small"
 
 
+def test_update_product_variant_with_current_attribute_values_reordered(
+    staff_api_client, variant, permission_manage_products
+):
+    # given
+    attribute = Attribute.objects.create(
+        slug="modes",
+        name="Available Modes",
+        input_type=AttributeInputType.MULTISELECT,
+        type=AttributeType.PRODUCT_TYPE,
+    )
+    attr_value_1 = AttributeValue.objects.create(
+        attribute=attribute, name="Eco Mode", slug="eco"
+    )
+    attr_value_2 = AttributeValue.objects.create(
+        attribute=attribute, name="Performance Mode", slug="power"
+    )
+    product_type = variant.product.product_type
+    product_type.variant_attributes.set([attribute])
+    associate_attribute_values_to_instance(
+        variant, attribute, attr_value_1, attr_value_2
+    )
+
+    variant_id = graphene.Node.to_global_id("ProductVariant", variant.pk)
+    attribute_id = graphene.Node.to_global_id("Attribute", attribute.pk)
+    variables = {
+        "id": variant_id,
+        "attributes": [
+            {"id": attribute_id, "values": [attr_value_2.slug, attr_value_1.slug]}
+        ],
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_UPDATE_VARIANT_ATTRIBUTES,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productVariantUpdate"]
+    assert not data["errors"]
+    values = data["productVariant"]["attributes"][0]["values"]
+    assert {value["slug"] for value in values} == {
+        attr_value_1.slug,
+        attr_value_2.slug,
+    }
+
+
 def test_update_product_variant_with_matching_slugs_different_values(
     staff_api_client,
     product_with_variant_with_two_attributes,
@@ -0,0 +1,61 @@
+import graphene
+
+from ....attribute.utils import associate_attribute_values_to_instance
+from ..utils import (
+    get_attribute_global_id,
+    get_attribute_values_fingerprint,
+    get_used_variants_attribute_values,
+)
+
+
+def test_get_used_variants_attribute_values(
+    product_with_variant_with_two_attributes, color_attribute, size_attribute
+):
+    # given
+    product = product_with_variant_with_two_attributes
+    variant = product.variants.first()
+    variant.pk = None
+    variant.sku = "prodVar2"
+    variant.save()
+    associate_attribute_values_to_instance(
+        variant, color_attribute, color_attribute.values.last()
+    )
+    color_attribute_id = graphene.Node.to_global_id("Attribute", color_attribute.pk)
+    size_attribute_id = graphene.Node.to_global_id("Attribute", size_attribute.pk)
+
+    # when
+    used_attribute_values = get_used_variants_attribute_values(product)
+
+    # then
+    assert used_attribute_values == {
+        frozenset(
+            {
+                (color_attribute_id, (color_attribute.values.first().slug,)),
+                (size_attribute_id, (size_attribute.values.first().slug,)),
+            }
+        ),
+        frozenset({(color_attribute_id, (color_attribute.values.last().slug,))}),
+    }
+
+
+def test_get_used_variants_attribute_values_variants_without_attributes(
+    product_with_two_variants,
+):
+    assert get_used_variants_attribute_values(product_with_two_variants) == set()
+
+
+def test_get_attribute_global_id(color_attribute):
+    assert get_attribute_global_id(color_attribute.pk) == graphene.Node.to_global_id(
+        "Attribute", color_attribute.pk
+    )
+
+
+def test_get_attribute_values_fingerprint_ignores_order():
+    fingerprint = get_attribute_values_fingerprint(
+        {"attr-1": ["b", "a"], "attr-2": ["c"]}
+    )
+
+    assert fingerprint == get_attribute_values_fingerprint(
+        {"attr-2": ["c"], "attr-1": ["a", "b"]}
+    )
+    assert fingerprint != get_attribute_values_fingerprint({"attr-1": ["a", "b"]})
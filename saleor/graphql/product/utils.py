@@ -1,11 +1,25 @@
 from collections import defaultdict, namedtuple
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import graphene
+from django.conf import settings
+from django.contrib.postgres.aggregates import ArrayAgg
 from django.core.exceptions import ValidationError
 from django.db import DatabaseError, transaction
 from django.db.utils import IntegrityError
 
+from ...attribute.models import AssignedVariantAttributeValue
 from ...core.tracing import traced_atomic_transaction
 from ...order import OrderStatus
 from ...order import models as order_models
@@ -22,6 +36,16 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def get_attribute_global_id(attribute_pk: int) -> str:
+    """Return the global ID of the attribute with given pk.
+
+    The result is cached, as the same attribute IDs are encoded over and over again
+    when validating the variant attributes.
+    """
+    return graphene.Node.to_global_id("Attribute", attribute_pk)
+
+
 def get_used_attribute_values_for_variant(variant):
     """Create a dict of attributes values for variant.
 
@@ -40,32 +64,82 @@ def get_used_attribute_values_for_variant(variant):
     return attribute_values
 
 
-def get_used_variants_attribute_values(product):
-    """Create list of attributes values for all existing `ProductVariants` for product.
+def get_attribute_values_fingerprint(
+    attribute_values: Dict[str, Iterable],
+) -> FrozenSet[Tuple[str, tuple]]:
+    """Return a hashable representation of attribute values assigned to a variant.
 
-    Sample result is:
-    [
-        {
-            "attribute_1_global_id": ["ValueAttr1_1"],
-            "attribute_2_global_id": ["ValueAttr2_1"]
-        },
+    The order of the attributes and of their values is not taken into account.
+    """
+    return frozenset(
+        (attribute_id, tuple(sorted(values)))
+        for attribute_id, values in attribute_values.items()
+    )
+
+
+def get_used_variants_attribute_values(product) -> Set[FrozenSet[Tuple[str, tuple]]]:
+    """Create set of attributes values for all existing `ProductVariants` for product.
+
+    Each variant is represented by the fingerprint of its attribute values,
+    see `get_attribute_values_fingerprint`. Sample result is:
+    {
+        frozenset(
+            {
+                ("attribute_1_global_id", ("ValueAttr1_1",)),
+                ("attribute_2_global_id", ("ValueAttr2_1",)),
+            }
+        ),
         ...
-        {
-            "attribute_1_global_id": ["ValueAttr1_2"],
-            "attribute_2_global_id": ["ValueAttr2_2"]
-        }
-    ]
+        frozenset(
+            {
+                ("attribute_1_global_id", ("ValueAttr1_2",)),
+                ("attribute_2_global_id", ("ValueAttr2_2",)),
+            }
+        ),
+    }
+    """
+    return get_used_variants_attribute_values_by_product_id([product.pk])[product.pk]
+
+
+def get_used_variants_attribute_values_by_product_id(
+    product_ids: Iterable[int],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> DefaultDict[int, Set[FrozenSet[Tuple[str, tuple]]]]:
+    """Create sets of attributes values of existing `ProductVariants` for products.
+
+    See `get_used_variants_attribute_values`.
     """
-    variants = (
-        product.variants.prefetch_related("attributes__values")
-        .prefetch_related("attributes__assignment")
-        .all()
+    values = (
+        AssignedVariantAttributeValue.objects.using(database_connection_name)
+        .filter(assignment__variant__product_id__in=product_ids)
+        .order_by()
+        .values(
+            "assignment__variant__product_id",
+            "assignment__variant_id",
+            "assignment__assignment__attribute_id",
+        )
+        .annotate(slugs=ArrayAgg("value__slug"))
+        .values_list(
+            "assignment__variant__product_id",
+            "assignment__variant_id",
+            "assignment__assignment__attribute_id",
+            "slugs",
+        )
     )
-    used_attribute_values = []
-    for variant in variants:
-        attribute_values = get_used_attribute_values_for_variant(variant)
-        if attribute_values:
-            used_attribute_values.append(attribute_values)
+    variants_attribute_values: Dict[
+        Tuple[int, int], Dict[str, List[str]]
+    ] = defaultdict(dict)
+    for product_id, variant_id, attribute_id, slugs in values:
+        attribute_global_id = get_attribute_global_id(attribute_id)
+        variants_attribute_values[(product_id, variant_id)][attribute_global_id] = slugs
+
+    used_attribute_values: DefaultDict[
+        int, Set[FrozenSet[Tuple[str, tuple]]]
+    ] = defaultdict(set)
+    for (product_id, _), attribute_values in variants_attribute_values.items():
+        used_attribute_values[product_id].add(
+            get_attribute_values_fingerprint(attribute_values)
+        )
     return used_attribute_values
 
 
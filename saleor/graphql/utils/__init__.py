@@ -1,7 +1,7 @@
 import hashlib
 import logging
 import traceback
-from typing import Union
+from typing import Dict, Union
 from uuid import UUID
 
 import graphene
@@ -107,15 +107,18 @@ def get_nodes(
         nodes = _get_node_for_types_with_double_id(qs, pks, graphene_type)
     else:
         nodes = list(qs.filter(pk__in=pks))
-        nodes.sort(key=lambda e: pks.index(str(e.pk)))  # preserve order in pks
+        pks_positions: Dict[str, int] = {}
+        for position, pk in enumerate(pks):
+            pks_positions.setdefault(pk, position)
+        nodes.sort(key=lambda e: pks_positions[str(e.pk)])  # preserve order in pks
 
     if not nodes:
         raise GraphQLError(ERROR_COULD_NO_RESOLVE_GLOBAL_ID % ids)
 
-    nodes_pk_list = [str(node.pk) for node in nodes]
+    nodes_pk_list = {str(node.pk) for node in nodes}
     if is_object_type_with_double_id:
         old_id_field = "number" if str(graphene_type) == "Order" else "old_id"
-        nodes_pk_list.extend([str(getattr(node, old_id_field)) for node in nodes])
+        nodes_pk_list.update(str(getattr(node, old_id_field)) for node in nodes)
     for pk in pks:
         assert pk in nodes_pk_list, "There is no node of type {} with pk {}".format(
             graphene_type, pk
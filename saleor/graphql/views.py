@@ -2,6 +2,7 @@ import fnmatch
 import hashlib
 import importlib
 import json
+from functools import lru_cache
 from inspect import isclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -31,6 +32,14 @@ from .utils import format_error, query_fingerprint, query_identifier
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
 
+# Number of parsed query documents kept in memory by each worker
+DOCUMENTS_CACHE_SIZE = 512
+# Longer queries are parsed on every request and never cached, so the cache holds
+# at most DOCUMENTS_CACHE_SIZE * DOCUMENTS_CACHE_MAX_QUERY_LENGTH characters
+# (8 MiB) of queries per worker, plus their documents which take several times
+# more memory than the query strings
+DOCUMENTS_CACHE_MAX_QUERY_LENGTH = 16 * 1024
+
 
 def tracing_wrapper(execute, sql, params, many, context):
     conn: DatabaseWrapper = context["connection"]
@@ -249,10 +258,7 @@ class GraphQLView(View):
 
         # Attempt to parse the query, if it fails, return the error
         try:
-            return (
-                self.backend.document_from_string(self.schema, query),  # type: ignore
-                None,
-            )
+            return document_from_string(self.backend, self.schema, query), None
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
@@ -447,6 +453,23 @@ def instantiate_middleware(middlewares):
         yield middleware
 
 
+def document_from_string(backend, schema, query: str) -> GraphQLDocument:
+    """Parse the query into a gql document object.
+
+    Documents are not modified during execution, so the documents of the most
+    recently seen queries are reused instead of parsing the same query again.
+    Queries longer than `DOCUMENTS_CACHE_MAX_QUERY_LENGTH` are not cached.
+    """
+    if len(query) > DOCUMENTS_CACHE_MAX_QUERY_LENGTH:
+        return backend.document_from_string(schema, query)
+    return cached_document_from_string(backend, schema, query)
+
+
+@lru_cache(maxsize=DOCUMENTS_CACHE_SIZE)
+def cached_document_from_string(backend, schema, query: str) -> GraphQLDocument:
+    return backend.document_from_string(schema, query)
+
+
 def generate_cache_key(raw_query: str) -> str:
     hashed_query = hashlib.sha256(str(raw_query).encode("utf-8")).hexdigest()
     return f"{saleor_version}-{hashed_query}"
@@ -125,6 +125,38 @@ def test_generate_and_set_variant_name_only_variant_selection_attributes(
     assert variant.name == "Big / Yellow, Blue, Red"
 
 
+def test_generate_and_set_variant_name_query_count(
+    variant_with_no_attributes,
+    color_attribute_without_values,
+    size_attribute,
+    django_assert_num_queries,
+):
+    # given
+    variant = variant_with_no_attributes
+    color_attribute = color_attribute_without_values
+    variant.product.product_type.variant_attributes.set(
+        (color_attribute, size_attribute), through_defaults={"variant_selection": True}
+    )
+    colors = AttributeValue.objects.bulk_create(
+        [
+            AttributeValue(attribute=color_attribute, name="Yellow", slug="yellow"),
+            AttributeValue(attribute=color_attribute, name="Blue", slug="blue"),
+        ]
+    )
+    associate_attribute_values_to_instance(variant, color_attribute, *tuple(colors))
+    associate_attribute_values_to_instance(
+        variant, size_attribute, size_attribute.values.get(slug="big")
+    )
+
+    # when
+    # the assigned attributes, their values and the values translations
+    with django_assert_num_queries(3):
+        generate_and_set_variant_name(variant, variant.sku, save=False)
+
+    # then
+    assert variant.name == "Big / Yellow, Blue"
+
+
 def test_generate_and_set_variant_name_only_not_variant_selection_attributes(
     variant_with_no_attributes, color_attribute_without_values, file_attribute
 ):
@@ -16,9 +16,9 @@ def generate_and_set_variant_name(
     variant_selection_attributes = variant.attributes.filter(
         assignment__variant_selection=True,
         assignment__attribute__type=AttributeType.PRODUCT_TYPE,
-    )
+    ).prefetch_related("values__translations")
     attribute_rel: AssignedVariantAttribute
-    for attribute_rel in variant_selection_attributes.iterator():
+    for attribute_rel in variant_selection_attributes:
         values_qs = attribute_rel.values.all()
         translated_values = [str(value.translated) for value in values_qs]
         attributes_display.append(", ".join(translated_values))